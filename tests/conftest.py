@@ -2,74 +2,86 @@
 Pytest configuration and fixtures for testing the FastAPI application.
 """
 
+from types import MappingProxyType
+
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from src.app import app, activities
 
 
-@pytest.fixture
+_httpx_response_json = httpx.Response.json
+
+
+def _orjson_response_json(self, **kwargs):
+    """Decode a response body with orjson.
+
+    orjson accepts no decoding options, so calls passing keyword arguments
+    fall back to httpx's own implementation, which forwards them to json.loads.
+    """
+    if kwargs:
+        return _httpx_response_json(self, **kwargs)
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_responses():
+    """Decode response bodies with orjson instead of the stdlib json module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", _orjson_response_json)
+        yield
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a single test client for the FastAPI app, shared by all tests.
 
+    Entering the client as a context manager keeps one event loop portal open
+    for the whole session instead of starting a new one for every request.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test."""
-    activities.clear()
-    activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and inter-school matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "alex@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Swimming lessons and competitive swimming events",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["sarah@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore various art mediums including painting and sculpture",
-            "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["emily@mergington.edu", "mia@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Theater production, acting workshops, and stage performances",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["liam@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through competitive debates",
-            "schedule": "Fridays, 4:00 PM - 6:00 PM",
-            "max_participants": 16,
-            "participants": ["sophia@mergington.edu", "noah@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Prepare for science competitions and conduct advanced experiments",
-            "schedule": "Tuesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["ava@mergington.edu", "william@mergington.edu"]
-        }
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Create an async client for tests that issue concurrent requests."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def _participants_snapshot():
+    """Capture each activity's initial participants once per session.
+
+    The snapshot is a read-only mapping of tuples, so it can be shared across
+    tests without copying.
+    """
+    return MappingProxyType({
+        name: tuple(details["participants"])
+        for name, details in activities.items()
     })
+
+
+@pytest.fixture(scope="session")
+def baseline_activities(client):
+    """Fetch the unmodified GET /activities response once for read-only checks."""
+    return client.get("/activities").json()
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request, _participants_snapshot):
+    """Restore activity participants after tests marked ``mutates_state``.
+
+    Restoring on teardown keeps the data pristine between tests, so session
+    fixtures created lazily mid-run still observe the initial state. Read-only
+    tests skip the restore entirely.
+    """
+    yield
+    if request.node.get_closest_marker("mutates_state") is None:
+        return
+    for name, participants in _participants_snapshot.items():
+        activities[name]["participants"][:] = participants
@@ -2,8 +2,17 @@
 Tests for the Mergington High School API endpoints.
 """
 
+import asyncio
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
+from src.app import activities
+
+# Participant pre-registered for Chess Club
+MICHAEL_EMAIL = "michael@mergington.edu"
+
+# URL-encoded activity name, computed once for the path-encoding test
+ENCODED_CHESS_CLUB = quote("Chess Club")
 
 
 def test_root_redirect(client):
@@ -18,133 +27,112 @@ def test_get_activities(client):
     response = client.get("/activities")
     assert response.status_code == 200
     
-    activities = response.json()
-    assert isinstance(activities, dict)
-    assert len(activities) == 9
-    assert "Chess Club" in activities
-    assert "Programming Class" in activities
+    data = response.json()
+    assert isinstance(data, dict)
+    assert len(data) == 9
+    assert "Chess Club" in data
+    assert "Programming Class" in data
     
     # Verify structure of an activity
-    chess_club = activities["Chess Club"]
+    chess_club = data["Chess Club"]
     assert "description" in chess_club
     assert "schedule" in chess_club
     assert "max_participants" in chess_club
     assert "participants" in chess_club
     assert chess_club["max_participants"] == 12
-    assert "michael@mergington.edu" in chess_club["participants"]
+    assert MICHAEL_EMAIL in chess_club["participants"]
 
 
+@pytest.mark.mutates_state
 def test_signup_for_activity_success(client):
     """Test successful signup for an activity."""
     email = "newstudent@mergington.edu"
     activity = "Chess Club"
     
-    response = client.post(f"/activities/{activity}/signup?email={email}")
+    response = client.post(f"/activities/{activity}/signup", params={"email": email})
     assert response.status_code == 200
     
     result = response.json()
     assert result["message"] == f"Signed up {email} for {activity}"
     
     # Verify the participant was added
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
     assert email in activities[activity]["participants"]
 
 
-def test_signup_duplicate_participant(client):
-    """Test that duplicate signup is rejected."""
-    email = "michael@mergington.edu"  # Already registered
-    activity = "Chess Club"
-    
-    response = client.post(f"/activities/{activity}/signup?email={email}")
-    assert response.status_code == 400
-    assert "already signed up" in response.json()["detail"]
-
-
-def test_signup_nonexistent_activity(client):
-    """Test signup for non-existent activity."""
-    email = "student@mergington.edu"
-    activity = "Nonexistent Activity"
-    
-    response = client.post(f"/activities/{activity}/signup?email={email}")
-    assert response.status_code == 404
-    assert "Activity not found" in response.json()["detail"]
-
-
+@pytest.mark.mutates_state
 def test_unregister_participant_success(client):
     """Test successful unregistration of a participant."""
-    email = "michael@mergington.edu"
+    email = MICHAEL_EMAIL
     activity = "Chess Club"
     
-    # Verify participant is registered initially
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
-    assert email in activities[activity]["participants"]
-    
     # Unregister the participant
-    response = client.delete(f"/activities/{activity}/unregister?email={email}")
+    response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
     assert response.status_code == 200
     
     result = response.json()
     assert result["message"] == f"Unregistered {email} from {activity}"
     
     # Verify the participant was removed
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
     assert email not in activities[activity]["participants"]
 
 
-def test_unregister_not_registered_participant(client):
-    """Test unregistering a participant who is not registered."""
-    email = "notregistered@mergington.edu"
-    activity = "Chess Club"
-    
-    response = client.delete(f"/activities/{activity}/unregister?email={email}")
-    assert response.status_code == 400
-    assert "not registered" in response.json()["detail"]
-
-
-def test_unregister_from_nonexistent_activity(client):
-    """Test unregistering from non-existent activity."""
-    email = "student@mergington.edu"
-    activity = "Nonexistent Activity"
-    
-    response = client.delete(f"/activities/{activity}/unregister?email={email}")
-    assert response.status_code == 404
-    assert "Activity not found" in response.json()["detail"]
-
-
+@pytest.mark.parametrize(
+    "method, path, email, status, detail",
+    [
+        pytest.param(
+            "post", "/activities/Chess Club/signup", MICHAEL_EMAIL, 400, "already signed up",
+            id="signup-duplicate",
+        ),
+        pytest.param(
+            "post", "/activities/Nonexistent Activity/signup", "student@mergington.edu", 404, "Activity not found",
+            id="signup-unknown-activity",
+        ),
+        pytest.param(
+            "delete", "/activities/Chess Club/unregister", "notregistered@mergington.edu", 400, "not registered",
+            id="unregister-not-registered",
+        ),
+        pytest.param(
+            "delete", "/activities/Nonexistent Activity/unregister", "student@mergington.edu", 404, "Activity not found",
+            id="unregister-unknown-activity",
+        ),
+    ],
+)
+def test_error_cases(client, method, path, email, status, detail):
+    """Test that invalid signup and unregister requests are rejected."""
+    response = getattr(client, method)(path, params={"email": email})
+    assert response.status_code == status
+    assert detail in response.json()["detail"]
+
+
+@pytest.mark.mutates_state
 def test_signup_and_unregister_flow(client):
     """Test complete flow of signing up and unregistering."""
     email = "testuser@mergington.edu"
     activity = "Swimming Club"
     
     # Get initial participant count
-    activities_response = client.get("/activities")
-    initial_count = len(activities_response.json()[activity]["participants"])
+    initial_count = len(activities[activity]["participants"])
     
     # Sign up
-    signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+    signup_response = client.post(f"/activities/{activity}/signup", params={"email": email})
     assert signup_response.status_code == 200
     
     # Verify participant was added
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
     assert email in activities[activity]["participants"]
     assert len(activities[activity]["participants"]) == initial_count + 1
     
     # Unregister
-    unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+    unregister_response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
     assert unregister_response.status_code == 200
     
     # Verify participant was removed
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
     assert email not in activities[activity]["participants"]
     assert len(activities[activity]["participants"]) == initial_count
 
 
-def test_multiple_participants_signup(client):
+@pytest.mark.asyncio
+@pytest.mark.mutates_state
+async def test_multiple_participants_signup(async_client):
     """Test multiple participants signing up for the same activity."""
     activity = "Drama Club"
     emails = [
@@ -153,56 +141,46 @@ def test_multiple_participants_signup(client):
         "student3@mergington.edu"
     ]
     
-    for email in emails:
-        response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response.status_code == 200
+    responses = await asyncio.gather(*(
+        async_client.post(f"/activities/{activity}/signup", params={"email": email})
+        for email in emails
+    ))
+    assert [response.status_code for response in responses] == [200] * len(emails)
     
     # Verify all were added
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
-    for email in emails:
-        assert email in activities[activity]["participants"]
+    assert set(emails) <= set(activities[activity]["participants"])
 
 
-def test_activity_capacity_tracking(client):
+def test_activity_capacity_tracking(baseline_activities):
     """Test that participant count is correctly tracked."""
     activity = "Art Studio"
     
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
-    
-    initial_count = len(activities[activity]["participants"])
-    max_participants = activities[activity]["max_participants"]
+    initial_count = len(baseline_activities[activity]["participants"])
+    max_participants = baseline_activities[activity]["max_participants"]
     
     assert initial_count <= max_participants
     assert initial_count == 2  # emily and mia initially
 
 
+@pytest.mark.mutates_state
 def test_url_encoded_activity_names(client):
     """Test that activity names with spaces are properly handled."""
     email = "test@mergington.edu"
-    activity = "Chess Club"
-    
-    # URL encode the activity name
-    import urllib.parse
-    encoded_activity = urllib.parse.quote(activity)
     
-    response = client.post(f"/activities/{encoded_activity}/signup?email={email}")
+    response = client.post(f"/activities/{ENCODED_CHESS_CLUB}/signup", params={"email": email})
     assert response.status_code == 200
+    assert email in activities["Chess Club"]["participants"]
 
 
+@pytest.mark.mutates_state
 def test_url_encoded_email(client):
     """Test that emails with special characters are properly handled."""
     email = "test+tag@mergington.edu"
     activity = "Gym Class"
     
-    import urllib.parse
-    encoded_email = urllib.parse.quote(email)
-    
-    response = client.post(f"/activities/{activity}/signup?email={encoded_email}")
+    # httpx encodes query params, so "+" is sent as "%2B" rather than a space
+    response = client.post(f"/activities/{activity}/signup", params={"email": email})
     assert response.status_code == 200
     
-    # Verify with proper encoding
-    activities_response = client.get("/activities")
-    activities = activities_response.json()
+    # Verify the email was stored unchanged
     assert email in activities[activity]["participants"]